@@ -3,8 +3,12 @@ import sys
 import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter import filedialog, messagebox
+import mmap
+import re
+import shutil
 import struct
-from typing import Dict, List, Tuple, Optional, Any
+import threading
+from typing import Dict, List, Set, Tuple, Optional, Any, Union
 
 # Constants
 PROPERTY_NAME_OFFSET = -6
@@ -13,123 +17,115 @@ CHARACTERS = [
     "Sova", "Fortune", "Huntress", "Blythe", "Fow-Chan"
 ]
 PROPERTY_KEYWORDS = ["Level", "CurrentXP", "BlueBallsXP", "UnspentPP", "CurrentDevotion", "DevotionLevel"]
+PROPERTY_KEYWORD_SET = frozenset(PROPERTY_KEYWORDS)
 MISC_KEYWORDS = ["BIO", "Tech", "Credits", "CheckedTrophyCount", "PandoraUnlockTriggerTally"]
+# A tagged IntProperty: the type name, the int32 Size (always 4), the int32
+# ArrayIndex (non-zero for elements of fixed-size arrays), the GUID flag byte
+# and the 4-byte value
+INT_PROPERTY_PATTERN = re.compile(
+    rb"IntProperty\x00"
+    rb"\x04\x00\x00\x00"
+    rb".{4}"
+    rb".(?P<value>.{4})",
+    re.DOTALL
+)
+UINT32_LE = struct.Struct('<I')
+UINT32_MAX = (1 << (8 * UINT32_LE.size)) - 1
 
 class SaveFileHandler:
     """Handles reading and writing save file data."""
     
     @staticmethod
-    def reverse_string(s: str) -> str:
-        """Reverse a string."""
-        return s[::-1]
+    def overwrite_int(content: bytearray, offset: int, new_val: int) -> None:
+        """Overwrite an integer in the content in place."""
+        UINT32_LE.pack_into(content, offset, new_val)
 
     @staticmethod
-    def unpack_int(byte_data: bytes) -> int:
-        """Unpack 4 bytes to an integer (little-endian)."""
-        if len(byte_data) < 4:
-            raise ValueError("Not enough data to unpack an integer")
-        return struct.unpack('<I', byte_data)[0]
-
-    @staticmethod
-    def int_to_bytes_le(n: int) -> bytes:
-        """Convert integer to 4 bytes (little-endian)."""
-        return struct.pack('<I', n)
-
-    @staticmethod
-    def overwrite_int(content: bytes, offset: int, new_val: int) -> bytes:
-        """Overwrite an integer in the content."""
-        return content[:offset] + SaveFileHandler.int_to_bytes_le(new_val) + content[offset + 4:]
-
-    @staticmethod
-    def read_int_properties(filename: str) -> Tuple[List[Dict[str, Any]], bytes]:
+    def read_int_properties(filename: str) -> Tuple[List[Dict[str, Any]], bytearray]:
         """Read .sav file and extract integer properties."""
         with open(filename, "rb") as file:
-            content = file.read()
+            if os.fstat(file.fileno()).st_size == 0:
+                return [], bytearray()
 
-        results = []
-        i = 0
-        while i < len(content):
-            start_pos = content.find(b"IntProperty", i)
-            if start_pos == -1:
-                break
-
-            name_start_pos = start_pos + PROPERTY_NAME_OFFSET
-            name_end_pos = name_start_pos
-            while name_end_pos > 0 and content[name_end_pos:name_end_pos + 1] != b"\0":
-                name_end_pos -= 1
-            name_end_pos += 1
-
-            if name_end_pos > 0:
-                raw_name = content[name_end_pos:start_pos].decode('utf-8')
-                prop_name = SaveFileHandler.reverse_string(raw_name)
-                prop_name = ''.join(c for c in prop_name if c.isprintable())
-
-                int_pos = start_pos + len("IntProperty") + 1
-                to_data_length = SaveFileHandler.unpack_int(content[int_pos:int_pos + 4])
-                int_pos += 4 + to_data_length
-
-                start_of_data = int_pos + 1
-
-                try:
-                    value = SaveFileHandler.unpack_int(content[start_of_data:start_of_data + 4])
-                    results.append({
-                        'name': SaveFileHandler.reverse_string(prop_name),
-                        'value': value,
-                        'data_start': start_of_data
-                    })
-                except ValueError as e:
-                    print(f"Error unpacking value at position {start_of_data}: {e}")
-
-            i = start_pos + 1
+            # Scan the mapped file directly; only the returned copy is read into memory
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                results = SaveFileHandler.find_int_properties(mapped)
+                content = bytearray(mapped)
 
         return results, content
 
+    @staticmethod
+    def find_int_properties(content: Union[bytes, mmap.mmap]) -> List[Dict[str, Any]]:
+        """Extract integer properties from raw save data."""
+        results = []
+        # Bind lookups used on every match to locals
+        append = results.append
+        rfind = content.rfind
+        unpack_from = UINT32_LE.unpack_from
+        name_offset = PROPERTY_NAME_OFFSET + 1
+
+        for match in INT_PROPERTY_PATTERN.finditer(content):
+            name_end_pos = match.start() + name_offset
+            if name_end_pos <= 0:
+                continue
+
+            # Skip tags with no NUL before them; there is no name boundary to find
+            name_start_pos = rfind(b"\0", 0, name_end_pos) + 1
+            if name_start_pos == 0:
+                continue
+
+            start_of_data = match.start('value')
+            prop_name = content[name_start_pos:name_end_pos].decode('utf-8')
+            append({
+                'name': prop_name,
+                'prefix': prop_name.partition('_')[0],
+                'value': unpack_from(content, start_of_data)[0],
+                'data_start': start_of_data
+            })
+
+        return results
+
 
 class CharacterPropertyManager:
     """Manages character property data and relationships."""
     
     @staticmethod
-    def get_unlocked_characters(properties: List[Dict[str, Any]]) -> Dict[str, bool]:
-        """Determine which characters are unlocked based on property counts."""
+    def build_all(properties: List[Dict[str, Any]]) -> Tuple[Dict[str, bool], Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Classify properties in a single pass, returning the unlocked map and property table."""
         character_property_counts = {char: 0 for char in CHARACTERS}
         keyword_occurrence_counters = {key: 0 for key in PROPERTY_KEYWORDS}
+        table = {char: {} for char in CHARACTERS}
 
         for prop in properties:
-            prop_name_parts = prop['name'].split('_')
-            for key in PROPERTY_KEYWORDS:
-                if prop_name_parts[0] in key:
-                    index = keyword_occurrence_counters[key]
-                    if index < len(CHARACTERS):
-                        character_property_counts[CHARACTERS[index]] += 1
-                        keyword_occurrence_counters[key] += 1
-                    break
-
-        return {
+            key = prop['prefix']
+            if key not in PROPERTY_KEYWORD_SET:
+                continue
+
+            occurrence_index = keyword_occurrence_counters[key]
+            if occurrence_index < len(CHARACTERS):
+                character_name = CHARACTERS[occurrence_index]
+                character_property_counts[character_name] += 1
+                table[character_name][key] = {
+                    **prop,
+                    'display_name': f"{key} ({occurrence_index + 1})"
+                }
+                keyword_occurrence_counters[key] += 1
+
+        unlocked_map = {
             char: (character_property_counts[char] >= len(PROPERTY_KEYWORDS))
             for char in CHARACTERS
         }
+        return unlocked_map, table
+
+    @staticmethod
+    def get_unlocked_characters(properties: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Determine which characters are unlocked based on property counts."""
+        return CharacterPropertyManager.build_all(properties)[0]
 
     @staticmethod
     def build_character_property_table(properties: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """Organize properties by character and keyword."""
-        table = {char: {} for char in CHARACTERS}
-        keyword_occurrence_counters = {key: 0 for key in PROPERTY_KEYWORDS}
-
-        for prop in properties:
-            prop_name_parts = prop['name'].split('_')
-            for key in PROPERTY_KEYWORDS:
-                if prop_name_parts[0] in key:
-                    occurrence_index = keyword_occurrence_counters[key]
-                    if occurrence_index < len(CHARACTERS):
-                        character_name = CHARACTERS[occurrence_index]
-                        table[character_name][key] = {
-                            **prop,
-                            'display_name': f"{key} ({occurrence_index + 1})"
-                        }
-                        keyword_occurrence_counters[key] += 1
-                    break
-
-        return table
+        return CharacterPropertyManager.build_all(properties)[1]
 
 
 def resource_path(relative_path):
@@ -156,11 +152,20 @@ class SaveEditorUI:
         self.filepath = ""
         self.savepath = ""
         self.properties: List[Dict[str, Any]] = []
-        self.content = b""
-        self.edited_values: Dict[str, int] = {}
+        self.property_table: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.unlocked_map: Dict[str, bool] = {}
+        self.content = bytearray()
+        self.edited_values: Dict[int, int] = {}  # Pending edits keyed by data offset
+        self.content_modified = False  # Whether the buffer differs from the file at filepath
         self.file_loaded = False
-        self.property_labels: Dict[str, tk.Label] = {}
-        self.property_entries: Dict[str, tk.Entry] = {}
+        self.load_generation = 0
+        self.io_pending = False  # Whether a read or write is running on a worker thread
+        self.property_labels: Dict[int, tk.Label] = {}  # Keyed by data offset
+        self.property_entries: Dict[int, tk.Entry] = {}
+        self.character_frames: Dict[str, ttk.Frame] = {}
+        self.current_character_frame: Optional[ttk.Frame] = None
+        self.pending_scroll_updates: Set[tk.Canvas] = set()
+        self.pending_scroll_deltas: Dict[tk.Canvas, int] = {}
         self.character_var: Optional[tk.StringVar] = None
         self.character_dropdown: Optional[ttk.OptionMenu] = None
 
@@ -183,7 +188,8 @@ class SaveEditorUI:
         ttk.Label(self.root, text="Load .sav file").grid(row=0, column=0, padx=5, pady=5)
         self.file_entry = ttk.Entry(self.root, width=40)
         self.file_entry.grid(row=0, column=1, padx=5, pady=5)
-        ttk.Button(self.root, text="Browse", command=self.open_file_dialog).grid(row=0, column=2, padx=5, pady=5)
+        self.browse_button = ttk.Button(self.root, text="Browse", command=self.open_file_dialog)
+        self.browse_button.grid(row=0, column=2, padx=5, pady=5)
 
         ttk.Label(self.root, text="Save as").grid(row=1, column=0, padx=5, pady=5)
         self.save_entry = ttk.Entry(self.root, width=40)
@@ -202,6 +208,9 @@ class SaveEditorUI:
         self.tab_control.add(self.misc_tab, text="MISC")
         self.create_misc_tab()
 
+        # One global wheel binding, routed to whichever tab is showing
+        self.root.bind_all("<MouseWheel>", self.on_mousewheel)
+
         self.root.grid_rowconfigure(2, weight=1)
         self.root.grid_columnconfigure(1, weight=1)
 
@@ -224,8 +233,7 @@ class SaveEditorUI:
         self.char_canvas.create_window((0, 0), window=self.char_property_frame, anchor="nw")
         self.char_canvas.configure(yscrollcommand=self.char_scrollbar.set)
 
-        self.char_property_frame.bind("<Configure>", lambda e: self.char_canvas.configure(scrollregion=self.char_canvas.bbox("all")))
-        self.char_canvas.bind_all("<MouseWheel>", lambda e: self.char_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.char_property_frame.bind("<Configure>", lambda e: self.schedule_scrollregion_update(self.char_canvas))
 
         self.character_var = tk.StringVar()
         self.character_dropdown = ttk.OptionMenu(
@@ -256,8 +264,7 @@ class SaveEditorUI:
         self.misc_canvas.create_window((0, 0), window=self.misc_property_frame, anchor="nw")
         self.misc_canvas.configure(yscrollcommand=self.misc_scrollbar.set)
 
-        self.misc_property_frame.bind("<Configure>", lambda e: self.misc_canvas.configure(scrollregion=self.misc_canvas.bbox("all")))
-        self.misc_canvas.bind_all("<MouseWheel>", lambda e: self.misc_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.misc_property_frame.bind("<Configure>", lambda e: self.schedule_scrollregion_update(self.misc_canvas))
 
         ttk.Label(
             self.misc_property_frame,
@@ -271,6 +278,35 @@ class SaveEditorUI:
             font=('Helvetica', 10, 'bold')
         ).grid(row=100, column=0, columnspan=3, pady=5, sticky="w")
 
+    def schedule_scrollregion_update(self, canvas: tk.Canvas) -> None:
+        """Coalesce scrollregion updates for a canvas into a single idle callback."""
+        if canvas in self.pending_scroll_updates:
+            return
+        self.pending_scroll_updates.add(canvas)
+
+        def update_scrollregion():
+            self.pending_scroll_updates.discard(canvas)
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        canvas.after_idle(update_scrollregion)
+
+    def on_mousewheel(self, event: tk.Event) -> None:
+        """Scroll the visible tab's canvas, coalescing wheel events into one scroll per idle."""
+        if str(self.tab_control.select()) == str(self.character_tab):
+            canvas = self.char_canvas
+        else:
+            canvas = self.misc_canvas
+
+        if canvas not in self.pending_scroll_deltas:
+            self.pending_scroll_deltas[canvas] = 0
+            canvas.after_idle(self.apply_scroll_delta, canvas)
+        self.pending_scroll_deltas[canvas] += event.delta
+
+    def apply_scroll_delta(self, canvas: tk.Canvas) -> None:
+        """Scroll a canvas by the wheel delta accumulated since the last idle."""
+        delta = self.pending_scroll_deltas.pop(canvas, 0)
+        canvas.yview_scroll(int(-1*(delta/120)), "units")
+
     def disable_save_button(self) -> None:
         """Disable the save button until a file is loaded."""
         self.save_button.config(state=tk.DISABLED)
@@ -279,8 +315,24 @@ class SaveEditorUI:
         """Enable the save button when a file is loaded."""
         self.save_button.config(state=tk.NORMAL)
 
+    def begin_io(self) -> None:
+        """Block loading and saving while a read or write runs on a worker thread."""
+        self.io_pending = True
+        self.browse_button.config(state=tk.DISABLED)
+        self.disable_save_button()
+
+    def end_io(self) -> None:
+        """Re-enable loading, and saving if a file is loaded, once the worker has finished."""
+        self.io_pending = False
+        self.browse_button.config(state=tk.NORMAL)
+        if self.file_loaded:
+            self.enable_save_button()
+
     def open_file_dialog(self) -> None:
         """Handle file selection and loading."""
+        if self.io_pending:
+            return
+
         self.clear_ui()
         file_path = filedialog.askopenfilename(filetypes=[("Save Files", "*.sav")])
         if file_path:
@@ -288,24 +340,67 @@ class SaveEditorUI:
             self.file_entry.insert(0, file_path)
             self.save_entry.delete(0, tk.END)
             self.save_entry.insert(0, file_path)
+            self.filepath = file_path
             
+            # Read on a worker thread so the window stays responsive on large saves
+            self.begin_io()
+            threading.Thread(
+                target=self.read_file,
+                args=(file_path, self.load_generation),
+                daemon=True
+            ).start()
+
+    def post_to_ui(self, callback, *args) -> None:
+        """Hand a worker thread's result back to the UI thread, unless the window has closed."""
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The main loop has exited or the window was destroyed; there is no UI left to report to
+            pass
+
+    def read_file(self, file_path: str, generation: int) -> None:
+        """Read and parse a save file off the UI thread, then hand the result back to it."""
+        try:
+            properties, content = SaveFileHandler.read_int_properties(file_path)
+        except Exception as e:
+            self.post_to_ui(self.on_file_read, generation, None, None, str(e))
+        else:
+            self.post_to_ui(self.on_file_read, generation, properties, content, None)
+
+    def on_file_read(self, generation: int, properties: Optional[List[Dict[str, Any]]],
+                     content: Optional[bytearray], error: Optional[str]) -> None:
+        """Display a file read by read_file, unless a newer file has been opened since."""
+        if generation != self.load_generation:
+            return
+
+        if error is None:
             try:
-                self.properties, self.content = SaveFileHandler.read_int_properties(file_path)
-                self.edited_values = {p['name']: p['value'] for p in self.properties}
+                self.properties, self.content = properties, content
+                self.unlocked_map, self.property_table = CharacterPropertyManager.build_all(self.properties)
+                self.edited_values = {}
                 self.display_properties()
                 self.file_loaded = True
-                self.enable_save_button()
+                self.end_io()
+                return
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to load file: {str(e)}")
-                self.file_loaded = False
-                self.disable_save_button()
+                error = str(e)
+
+        self.file_loaded = False
+        self.end_io()
+        messagebox.showerror("Error", f"Failed to load file: {error}")
 
     def clear_ui(self) -> None:
         """Clear all UI elements related to properties."""
         self.properties = []
+        self.property_table = {}
+        self.unlocked_map = {}
         self.edited_values = {}
-        self.content = b""
+        self.content = bytearray()
+        self.content_modified = False
+        self.filepath = ""
         self.file_loaded = False
+        # Invalidate any read still in flight, even if the dialog is cancelled
+        self.load_generation += 1
 
         for widget in self.char_property_frame.winfo_children()[1:]:
             widget.destroy()
@@ -316,88 +411,59 @@ class SaveEditorUI:
 
         self.property_labels = {}
         self.property_entries = {}
+        self.character_frames = {}
+        self.current_character_frame = None
 
     def display_properties(self) -> None:
         """Display all properties in their respective tabs."""
-        unlocked_map = CharacterPropertyManager.get_unlocked_characters(self.properties)
         display_names = [
-            f"{char} {'(Locked)' if not unlocked_map[char] else ''}" 
+            f"{char} {'(Locked)' if not self.unlocked_map[char] else ''}" 
             for char in CHARACTERS
         ]
         
         menu = self.character_dropdown['menu']
         menu.delete(0, 'end')
-        for name in display_names:
+        for char, name in zip(CHARACTERS, display_names):
             menu.add_command(
                 label=name,
-                command=lambda n=name: [
+                command=lambda n=name, c=char: [
                     self.character_var.set(n),
-                    self.update_character_properties(n.split()[0])
+                    self.update_character_properties(c)
                 ]
             )
 
 
         self.character_var.set(display_names[0])
-        self.update_character_properties(display_names[0].split()[0])
+        self.update_character_properties(CHARACTERS[0])
         
         self.update_misc_properties()
 
-    def update_character_properties(self, selected_character: str) -> None:
-        normalized_character = selected_character.split(' ')[0]
+    def create_character_frame(self, character: str) -> ttk.Frame:
+        """Create the frame of property widgets for a character."""
+        frame = ttk.Frame(self.char_property_frame)
+        props_for_char = self.property_table.get(character, {})
 
-        # Clear previous widgets (except dropdown)
-        for widget in self.char_property_frame.winfo_children()[1:]:
-            widget.destroy()
-
-        property_table = CharacterPropertyManager.build_character_property_table(self.properties)
-        props_for_char = property_table.get(normalized_character, {})
-
-        row = 1
+        row = 0
         for key in PROPERTY_KEYWORDS:
             if key in props_for_char:
                 prop = props_for_char[key]
-                self.create_character_property_widget(row, prop)
+                self.create_character_property_widget(frame, row, prop)
                 row += 1
 
-        self.char_property_frame.update_idletasks()
-        self.char_canvas.config(scrollregion=self.char_canvas.bbox("all"))
+        self.character_frames[character] = frame
+        return frame
 
-    def create_character_property_widget(self, row: int, prop: Dict[str, Any]) -> None:
-        """Create widgets for a character property."""
-        label = ttk.Label(
-            self.char_property_frame,
-            text=prop.get('display_name', prop['name']),
-            anchor='w'
-        )
-        label.grid(row=row, column=0, sticky='w', padx=5, pady=2)
-
-        entry = ttk.Entry(self.char_property_frame, width=20)
-        entry.insert(0, str(prop['value']))
-        entry.config(state='normal')
-        entry.grid(row=row, column=1, padx=5, pady=2)
-
-        self.property_labels[prop['name']] = label
-        self.property_entries[prop['name']] = entry
+    def update_character_properties(self, selected_character: str) -> None:
+        # Swap the visible character frame; the widgets themselves are kept alive
+        if self.current_character_frame is not None:
+            self.current_character_frame.grid_remove()
 
-        # Set up change tracking
-        entry_var = tk.StringVar()
-        entry_var.set(str(prop['value']))
-        entry.config(textvariable=entry_var)
-        
-        def on_change(*args, lbl=label):
-            current_text = lbl.cget("text")
-            if not current_text.startswith("*"):
-                lbl.config(text=f"* {current_text}")
-        
-        entry_var.trace_add("write", on_change)
-
-        # Apply button
-        apply_btn = ttk.Button(
-            self.char_property_frame,
-            text="Apply",
-            command=lambda: self.apply_property_change(entry, prop)
-        )
-        apply_btn.grid(row=row, column=2, padx=5, pady=2)
+        # Frames are built the first time a character is shown, then reused
+        self.current_character_frame = self.character_frames.get(selected_character)
+        if self.current_character_frame is None and selected_character in self.property_table:
+            self.current_character_frame = self.create_character_frame(selected_character)
+        if self.current_character_frame is not None:
+            self.current_character_frame.grid(row=1, column=0, columnspan=3, sticky='nw')
 
     def update_misc_properties(self) -> None:
         """Update MISC tab with all non-character properties."""
@@ -406,18 +472,19 @@ class SaveEditorUI:
             if isinstance(widget, (ttk.Label, ttk.Entry, ttk.Button)):
                 widget.destroy()
 
-        # Organize properties
+        # Organize properties; character properties are the ones already in the table
         misc_props = []
         advanced_props = []
+        character_offsets = {
+            prop['data_start']
+            for props_for_char in self.property_table.values()
+            for prop in props_for_char.values()
+        }
         
         for prop in self.properties:
             prop_name = prop['name']
             is_misc = any(keyword in prop_name for keyword in MISC_KEYWORDS)
-            is_character = any(
-                keyword in prop_name and char in prop_name
-                for keyword in PROPERTY_KEYWORDS
-                for char in CHARACTERS
-            )
+            is_character = prop['data_start'] in character_offsets
             
             if is_misc and not is_character:
                 misc_props.append(prop)
@@ -435,9 +502,6 @@ class SaveEditorUI:
         for prop in advanced_props:
             self.create_misc_property_widget(row, prop, True)
             row += 1
-            
-        self.misc_property_frame.update_idletasks()
-        self.misc_canvas.config(scrollregion=self.misc_canvas.bbox("all"))
 
     def create_misc_property_widget(self, row: int, prop: Dict[str, Any], is_advanced: bool) -> None:
         """Create widgets for a MISC property."""
@@ -451,7 +515,6 @@ class SaveEditorUI:
             text=label_text,
             foreground="red" if is_advanced else "black"
         )
-        print(label_text)
         label.grid(row=row, column=0, sticky='w', padx=5, pady=2)
         
         # Create the entry widget
@@ -478,26 +541,26 @@ class SaveEditorUI:
                 
         entry.bind('<KeyRelease>', on_change)
 
-    def create_character_property_widget(self, row: int, prop: Dict[str, Any]) -> None:
+    def create_character_property_widget(self, parent: ttk.Frame, row: int, prop: Dict[str, Any]) -> None:
         """Create widgets for a character property."""
         label = ttk.Label(
-            self.char_property_frame,
+            parent,
             text=prop.get('display_name', prop['name']),
             anchor='w'
         )
         label.grid(row=row, column=0, sticky='w', padx=5, pady=2)
 
-        entry = ttk.Entry(self.char_property_frame, width=20)
+        entry = ttk.Entry(parent, width=20)
         entry.delete(0, tk.END)
         entry.insert(0, str(prop['value']))
         entry.grid(row=row, column=1, padx=5, pady=2)
 
-        self.property_labels[prop['name']] = label
-        self.property_entries[prop['name']] = entry
+        self.property_labels[prop['data_start']] = label
+        self.property_entries[prop['data_start']] = entry
 
         # Apply button with updated command
         apply_btn = ttk.Button(
-            self.char_property_frame,
+            parent,
             text="Apply",
             command=lambda e=entry, p=prop: self.apply_property_change(e, p)
         )
@@ -515,26 +578,21 @@ class SaveEditorUI:
         """Apply a single property change without refreshing other properties."""
         try:
             new_val = int(entry.get())
+            if not 0 <= new_val <= UINT32_MAX:
+                raise ValueError("Value out of range")
             
-            # Update the content buffer
-            self.content = SaveFileHandler.overwrite_int(
-                self.content,
-                prop_info['data_start'],
-                new_val
-            )
+            # Queue the edit; the content buffer is only written on save
+            self.edited_values[prop_info['data_start']] = new_val
             
-            # Update the specific property in our properties list
-            for prop in self.properties:
-                if prop['name'] == prop_info['name'] and prop['data_start'] == prop_info['data_start']:
-                    prop['value'] = new_val
-                    break
+            # Keep the property dict's value current
+            prop_info['value'] = new_val
                     
             # Update the entry widget directly without refreshing others
             entry.delete(0, tk.END)
             entry.insert(0, str(new_val))
             
             # Update the label to remove the "*" change indicator
-            label = self.property_labels.get(prop_info['name'])
+            label = self.property_labels.get(prop_info['data_start'])
             if label:
                 current_text = label.cget("text")
                 if current_text.startswith("*"):
@@ -553,6 +611,9 @@ class SaveEditorUI:
 
     def save_file(self) -> None:
         """Handle file saving."""
+        if self.io_pending:
+            return
+
         if not self.file_loaded:
             messagebox.showwarning("Warning", "No file loaded.")
             return
@@ -565,14 +626,61 @@ class SaveEditorUI:
         
         if save_path:
             try:
-                # Refresh the edited_values dictionary before saving
-                self.edited_values = {p['name']: p['value'] for p in self.properties}
-                
-                with open(save_path, "wb") as file:
-                    file.write(self.content)
-                messagebox.showinfo("Success", f"File saved to {save_path}")
+                # Write all pending edits into the content buffer in one pass
+                for offset, new_val in self.edited_values.items():
+                    SaveFileHandler.overwrite_int(self.content, offset, new_val)
+                    self.content_modified = True
+                self.edited_values = {}
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save file: {str(e)}")
+                return
+
+            # An unmodified buffer can be copied from the original file by the OS
+            source_path = None
+            if not self.content_modified and not self.is_same_path(save_path, self.filepath):
+                source_path = self.filepath
+
+            # Write on a worker thread; loading and saving stay disabled so neither
+            # touches the file or the buffer meanwhile
+            self.begin_io()
+            threading.Thread(target=self.write_file, args=(save_path, self.content, source_path)).start()
+
+    @staticmethod
+    def is_same_path(path_a: str, path_b: str) -> bool:
+        """Check whether two paths refer to the same file location."""
+        try:
+            # Catches symlinks, hardlinks and mapped drives, but needs both files to exist
+            return os.path.samefile(path_a, path_b)
+        except OSError:
+            return os.path.normcase(os.path.abspath(path_a)) == os.path.normcase(os.path.abspath(path_b))
+
+    def write_file(self, save_path: str, content: bytearray, source_path: Optional[str] = None) -> None:
+        """Write the content buffer (or copy source_path) off the UI thread, then report back on it."""
+        try:
+            copied = False
+            if source_path:
+                try:
+                    shutil.copyfile(source_path, save_path)
+                    copied = True
+                except OSError:
+                    # The original may have moved or be the target after all; the buffer is complete
+                    pass
+            if not copied:
+                with open(save_path, "wb") as file:
+                    file.write(content)
+        except Exception as e:
+            self.post_to_ui(self.on_file_saved, save_path, str(e))
+        else:
+            self.post_to_ui(self.on_file_saved, save_path, None)
+
+    def on_file_saved(self, save_path: str, error: Optional[str]) -> None:
+        """Report the result of write_file."""
+        self.end_io()
+
+        if error is None:
+            messagebox.showinfo("Success", f"File saved to {save_path}")
+        else:
+            messagebox.showerror("Error", f"Failed to save file: {error}")
 
 
 def main():